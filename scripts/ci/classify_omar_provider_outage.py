@@ -47,21 +47,22 @@ def _load_findings(path: Path) -> list[dict[str, Any]]:
         raise ProviderOutageClassifierError(f"findings file not found: {path}")
 
     findings: list[dict[str, Any]] = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        try:
-            payload = json.loads(stripped)
-        except json.JSONDecodeError as exc:
-            raise ProviderOutageClassifierError(
-                f"invalid findings JSON on line {line_number}"
-            ) from exc
-        if not isinstance(payload, dict):
-            raise ProviderOutageClassifierError(
-                f"finding on line {line_number} is not a JSON object"
-            )
-        findings.append(payload)
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                payload = json.loads(stripped)
+            except json.JSONDecodeError as exc:
+                raise ProviderOutageClassifierError(
+                    f"invalid findings JSON on line {line_number}"
+                ) from exc
+            if not isinstance(payload, dict):
+                raise ProviderOutageClassifierError(
+                    f"finding on line {line_number} is not a JSON object"
+                )
+            findings.append(payload)
     return findings
 
 
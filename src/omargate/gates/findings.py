@@ -16,7 +16,7 @@ Severity = Literal["P0", "P1", "P2", "P3"]
 Decision = Literal["allow", "deny", "ask"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     """A single gate finding.
 
@@ -75,6 +75,7 @@ _FIX_CMD_PATTERN = re.compile(
     """,
     re.VERBOSE,
 )
+_BRANCH_SLUG_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]+")
 
 
 @dataclass(frozen=True)
@@ -253,7 +254,7 @@ def _finding_id(finding: Finding) -> str:
 def _build_branch_name(finding: Finding, persona: str) -> str:
     # Deterministic-enough to dedupe across retries; keep it git-safe.
     fid = _finding_id(finding)
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", fid).strip("-").lower()[:60]
+    slug = _BRANCH_SLUG_UNSAFE_RE.sub("-", fid).strip("-").lower()[:60]
     return f"omar-fix/{persona}/{slug}"
 
 
@@ -10,6 +10,7 @@ it under the security-review contract.
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
@@ -109,17 +110,18 @@ def _resolve_inside_repo(repo_root: Path, raw_path: str) -> Path | None:
 def _load_raw_findings(path: Path) -> list[dict[str, Any]]:
     if path.suffix.lower() == ".jsonl":
         out: list[dict[str, Any]] = []
-        for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-            raw = line.strip()
-            if not raw:
-                continue
-            try:
-                row = json.loads(raw)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"invalid JSONL at line {line_no}: {exc}") from exc
-            if not isinstance(row, dict):
-                raise ValueError(f"invalid JSONL at line {line_no}: expected object")
-            out.append(row)
+        with path.open("r", encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                raw = line.strip()
+                if not raw:
+                    continue
+                try:
+                    row = json.loads(raw)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"invalid JSONL at line {line_no}: {exc}") from exc
+                if not isinstance(row, dict):
+                    raise ValueError(f"invalid JSONL at line {line_no}: expected object")
+                out.append(row)
         return out
 
     try:
@@ -162,14 +164,8 @@ def _error_result(raw_path: str, reason: str) -> GateResult:
 
 
 def _rejection_counts(result: FilterResult) -> dict[str, int]:
-    counts = {
-        "confidence": 0,
-        "exclusion": 0,
-        "precedent": 0,
-        "category": 0,
-        "schema": 0,
+    tally = Counter(rejected.category for rejected in result.rejected)
+    return {
+        category: tally[category]
+        for category in ("confidence", "exclusion", "precedent", "category", "schema")
     }
-    for rejected in result.rejected:
-        if rejected.category in counts:
-            counts[rejected.category] += 1
-    return counts
@@ -73,7 +73,7 @@ SUPPORTED_CATEGORIES: frozenset[str] = frozenset({
 # contexts because they are classically noisy, theoretical, or out of
 # scope for Omar Gate 2.0. LLM outputs that match are dropped into the
 # hard_exclusion bucket. Matching uses word-boundary regex (see
-# `_phrase_matches`) so "rate-limit bypass" no longer shadows distinct
+# `_phrase_pattern`) so "rate-limit bypass" no longer shadows distinct
 # strings that merely contain those words in unrelated positions.
 #
 # Lifted from src/commands/security-review.ts:143-161 (HARD EXCLUSIONS
@@ -124,7 +124,7 @@ PRECEDENTS: tuple[str, ...] = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RejectedFinding:
     """A raw LLM finding that didn't make it through the filter."""
 
@@ -344,34 +344,33 @@ def filter_llm_findings(
     return result
 
 
-def _phrase_matches(phrase: str, haystack: str) -> bool:
-    """Word-boundary match: phrase must appear as a delimited token in haystack.
+def _phrase_pattern(phrases: tuple[str, ...]) -> re.Pattern[str]:
+    """Word-boundary pattern: any phrase must appear as a delimited token in haystack.
 
     Replaces the prior naive `phrase in haystack` substring check so that
     short phrases like "rate-limit bypass" don't shadow an unrelated
     finding that happens to contain those tokens in different positions.
 
-    Both phrase and haystack are expected to be lower-case already. The
-    pattern uses `\\b` boundaries on the outer edges of the escaped
+    Phrases are lower-case and haystacks are lower-cased before matching.
+    The pattern uses `\\b` boundaries on the outer edges of each escaped
     phrase, which means hyphenated phrases like "rate-limit bypass"
     match `rate-limit bypass` as a contiguous run but not when those
-    words appear with intervening tokens.
+    words appear with intervening tokens. All phrases share one
+    alternation so each haystack is scanned once rather than per phrase.
     """
-    pattern = r"\b" + re.escape(phrase) + r"\b"
-    return re.search(pattern, haystack) is not None
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, phrases)) + r")\b")
+
+
+# Compiled once at import; the filter runs these against every finding.
+_HARD_EXCLUSION_PATTERN = _phrase_pattern(HARD_EXCLUSIONS)
+_PRECEDENT_PATTERN = _phrase_pattern(PRECEDENTS)
 
 
 def _matches_hard_exclusion(title: str, description: str, category: str) -> bool:
     haystack = f"{title} {description} {category}".lower()
-    for phrase in HARD_EXCLUSIONS:
-        if _phrase_matches(phrase, haystack):
-            return True
-    return False
+    return _HARD_EXCLUSION_PATTERN.search(haystack) is not None
 
 
 def _matches_precedent(title: str, description: str) -> bool:
     haystack = f"{title} {description}".lower()
-    for phrase in PRECEDENTS:
-        if _phrase_matches(phrase, haystack):
-            return True
-    return False
+    return _PRECEDENT_PATTERN.search(haystack) is not None
@@ -290,11 +290,11 @@ def dispatch_personas(
     result.unrouted_files = sorted(set(unrouted))
 
     for persona, files in sorted(buckets.items()):
-        deduped = sorted(set(files))[: config.per_persona_max_files]
+        capped_files = sorted(files)[: config.per_persona_max_files]
         if config.dry_run:
             result.personas_invoked.append(persona)
             continue
-        exit_code, stdout, stderr = _spawn_persona_cli(config, persona, deduped)
+        exit_code, stdout, stderr = _spawn_persona_cli(config, persona, capped_files)
         if exit_code not in (0, 1):
             # 0 = clean, 1 = findings emitted. Anything else = persona crashed.
             result.personas_failed.append(persona)
@@ -302,7 +302,7 @@ def dispatch_personas(
                 result.persona_findings.append(
                     _strict_persona_failure_finding(
                         persona=persona,
-                        files=deduped,
+                        files=capped_files,
                         exit_code=exit_code,
                         stdout=stdout,
                         stderr=stderr,
@@ -29,10 +29,12 @@ from __future__ import annotations
 
 import fnmatch
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, Literal
+from typing import Any, Iterable, Iterator, Literal
 
 from ..path_safety import EXCLUDED_PATH_PREFIXES
 from . import GateContext, GateResult
@@ -161,6 +163,10 @@ _SCAN_EXCLUDED_PREFIXES = EXCLUDED_PATH_PREFIXES | frozenset(
 )
 
 _MAX_POLICY_FILE_BYTES = 1_000_000
+# Reads are I/O bound, so a small thread pool overlaps them. Files are handed
+# to the pool in fixed-size batches to bound how much text is held in memory.
+_POLICY_READ_WORKERS = 8
+_POLICY_READ_BATCH = 64
 _MAX_POLICY_PATTERN_CHARS = 500
 _REGEX_QUANTIFIER = r"(?:[*+?]|\{\d+(?:,\d*)?\})"
 _UNSAFE_NESTED_QUANTIFIER_RE = re.compile(
@@ -428,6 +434,14 @@ class PolicyGate:
             except re.error as exc:
                 compiled.append((idx, pattern, None, str(exc), "invalid-regex"))
 
+        matches = _scan_for_patterns(
+            ctx.repo_root,
+            [
+                (idx, pattern, regex)
+                for idx, pattern, regex, error, _ in compiled
+                if error is None and regex is not None
+            ],
+        )
         policy_file = _policy_path_for_finding(ctx.repo_root, self._policy_path)
         for idx, pattern, regex, error, error_kind in compiled:
             if error is not None:
@@ -456,7 +470,7 @@ class PolicyGate:
                 continue
             if regex is None:
                 continue
-            findings.extend(_scan_for_pattern(ctx.repo_root, idx, pattern, regex))
+            findings.extend(matches[idx])
 
         return GateResult(
             gate_id=self.gate_id,
@@ -608,55 +622,120 @@ def _strip_group_prefix(body: str) -> str:
     return body
 
 
-def _scan_for_pattern(
+def _scan_for_patterns(
     repo_root: Path,
-    idx: int,
-    pattern: ForbidPattern,
-    regex: re.Pattern[str],
-) -> list[Finding]:
-    findings: list[Finding] = []
+    rules: list[tuple[int, ForbidPattern, re.Pattern[str]]],
+) -> dict[int, list[Finding]]:
+    """Scan the repository once for every compiled forbid pattern.
+
+    Each candidate file is read and split into lines a single time, then
+    checked against every rule whose `in` glob admits it. Findings are
+    keyed by rule index and keep walk + line order within each rule.
+    """
+    matches: dict[int, list[Finding]] = {idx: [] for idx, _, _ in rules}
+    if not rules:
+        return matches
+
+    # Group rules by `in` glob so each distinct glob is tested once per file,
+    # however many rules share it.
+    rules_by_glob: dict[str | None, list[tuple[int, ForbidPattern, re.Pattern[str]]]] = {}
+    for rule in rules:
+        rules_by_glob.setdefault(rule[1].in_glob or None, []).append(rule)
+
+    rule_groups = [
+        (_compile_glob(in_glob) if in_glob else None, grouped)
+        for in_glob, grouped in rules_by_glob.items()
+    ]
+
+    candidates: list[tuple[Path, str, list[tuple[int, ForbidPattern, re.Pattern[str]]]]] = []
     for path in _iter_policy_scan_files(repo_root):
         rel = path.relative_to(repo_root).as_posix()
-        if pattern.in_glob and not _glob_matches(rel, pattern.in_glob):
+        name = path.name
+        applicable = [
+            rule
+            for glob, grouped in rule_groups
+            if glob is None or glob.match(rel) or glob.match(name)
+            for rule in grouped
+        ]
+        if applicable:
+            candidates.append((path, rel, applicable))
+
+    texts = _read_policy_scan_texts([path for path, _, _ in candidates])
+    for (_, rel, applicable), text in zip(candidates, texts):
+        if text is None:
             continue
-        try:
-            if path.stat().st_size > _MAX_POLICY_FILE_BYTES:
-                continue
-            text = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-        for line_no, line in enumerate(text.splitlines(), start=1):
-            if not regex.search(line):
-                continue
-            findings.append(
-                Finding(
-                    gate_id="policy",
-                    tool="forbid-patterns",
-                    severity=_normalize_severity(pattern.severity),
-                    file=rel,
-                    line=line_no,
-                    title=pattern.message or "Forbidden policy pattern matched",
-                    description=f"Configured forbid pattern matched: {pattern.pattern}",
-                    rule_id=f"policy:forbid-pattern:{idx}",
-                    evidence=line.strip()[:240],
-                    decision=pattern.behavior,
+        lines = text.splitlines()
+        for idx, pattern, regex in applicable:
+            for line_no, line in enumerate(lines, start=1):
+                if not regex.search(line):
+                    continue
+                matches[idx].append(
+                    Finding(
+                        gate_id="policy",
+                        tool="forbid-patterns",
+                        severity=_normalize_severity(pattern.severity),
+                        file=rel,
+                        line=line_no,
+                        title=pattern.message or "Forbidden policy pattern matched",
+                        description=f"Configured forbid pattern matched: {pattern.pattern}",
+                        rule_id=f"policy:forbid-pattern:{idx}",
+                        evidence=line.strip()[:240],
+                        decision=pattern.behavior,
+                    )
                 )
-            )
-    return findings
+    return matches
+
+
+def _read_policy_scan_texts(paths: list[Path]) -> Iterator[str | None]:
+    """Yield each file's text in input order, or None when it is skipped.
+
+    Unreadable, oversized, and non-UTF-8 files are skipped.
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=_POLICY_READ_WORKERS) as pool:
+        for start in range(0, len(paths), _POLICY_READ_BATCH):
+            yield from pool.map(_read_policy_scan_text, paths[start : start + _POLICY_READ_BATCH])
+
+
+def _read_policy_scan_text(path: Path) -> str | None:
+    # Reads at most _MAX_POLICY_FILE_BYTES + 1 bytes; getting the extra byte
+    # means the file is oversized and it is skipped.
+    try:
+        with path.open("rb") as handle:
+            data = handle.read(_MAX_POLICY_FILE_BYTES + 1)
+    except OSError:
+        return None
+    if len(data) > _MAX_POLICY_FILE_BYTES:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
 
 
 def _iter_policy_scan_files(repo_root: Path) -> Iterable[Path]:
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
-        rel_parts = path.relative_to(repo_root).parts
-        if any(part in _SCAN_EXCLUDED_PREFIXES for part in rel_parts):
-            continue
-        yield path
+    # Prune excluded directories in place so the walk never descends into
+    # node_modules, .git, or build output at all.
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        dirnames[:] = [name for name in dirnames if name not in _SCAN_EXCLUDED_PREFIXES]
+        base = Path(dirpath)
+        for name in filenames:
+            if name in _SCAN_EXCLUDED_PREFIXES:
+                continue
+            path = base / name
+            if path.is_file():
+                yield path
+
 
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile an `in` glob once for matching against every scanned file.
 
-def _glob_matches(rel: str, pattern: str) -> bool:
-    return fnmatch.fnmatch(rel, pattern) or fnmatch.fnmatch(Path(rel).name, pattern)
+    Callers try the repo-relative posix path first, then the basename.
+    Matching is case-sensitive, the same as `fnmatch.fnmatch` on POSIX
+    runners.
+    """
+    return re.compile(fnmatch.translate(pattern))
 
 
 def _normalize_severity(value: str) -> Severity:
@@ -1,7 +1,8 @@
 """Security scan gate (Layer 4 of Omar Gate 2.0).
 
-Runs six deterministic scanners in sequence (concurrency can be added
-later if runtime pressure warrants it). Each scanner is skipped silently
+Runs six deterministic scanners on a small thread pool (each scanner is
+a subprocess, so threads overlap their wall time; findings and tool
+metadata keep the fixed scanner order). Each scanner is skipped silently
 when its runtime binary isn't on PATH — callers can invoke this gate in
 mixed-language / partial-toolchain environments without failure.
 
@@ -28,6 +29,7 @@ from __future__ import annotations
 import json
 import shutil
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +40,10 @@ from .static import _scrubbed_env
 
 __all__ = ["SecurityScanGate"]
 
+# Scanners like semgrep and checkov are CPU- and memory-hungry; three at a
+# time keeps a standard hosted runner responsive.
+_DEFAULT_MAX_WORKERS = 3
+
 
 # ---------- public gate class ----------
 
@@ -56,7 +62,9 @@ class SecurityScanGate:
         actionlint: bool = True,
         checkov: bool = True,
         tflint: bool = True,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
     ) -> None:
+        self._max_workers = max(1, int(max_workers))
         self._tools: list[tuple[str, bool]] = [
             ("gitleaks", gitleaks),
             ("semgrep", semgrep),
@@ -70,16 +78,28 @@ class SecurityScanGate:
         findings: list[Finding] = []
         tools_meta: list[dict[str, Any]] = []
 
-        for tool_name, enabled in self._tools:
-            if not enabled:
-                tools_meta.append({"tool": tool_name, "invoked": False, "reason": "disabled"})
-                continue
-            if shutil.which(tool_name) is None:
-                tools_meta.append({"tool": tool_name, "invoked": False, "reason": "binary-not-on-path"})
-                continue
+        # Skipped tools resolve to their meta immediately; the rest are
+        # submitted to the pool and collected back in scanner order.
+        outcomes: list[dict[str, Any] | Future[tuple[list[Finding], dict[str, Any]]]] = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            for tool_name, enabled in self._tools:
+                if not enabled:
+                    outcomes.append({"tool": tool_name, "invoked": False, "reason": "disabled"})
+                    continue
+                if shutil.which(tool_name) is None:
+                    outcomes.append(
+                        {"tool": tool_name, "invoked": False, "reason": "binary-not-on-path"}
+                    )
+                    continue
+
+                runner = getattr(self, f"_run_{tool_name.replace('-', '_')}")
+                outcomes.append(pool.submit(runner, ctx))
 
-            runner = getattr(self, f"_run_{tool_name.replace('-', '_')}")
-            tool_findings, meta = runner(ctx)
+        for outcome in outcomes:
+            if isinstance(outcome, dict):
+                tools_meta.append(outcome)
+                continue
+            tool_findings, meta = outcome.result()
             findings.extend(tool_findings)
             tools_meta.append(meta)
 
@@ -104,7 +124,7 @@ class SecurityScanGate:
                 timeout=180,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_gitleaks_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
@@ -122,7 +142,7 @@ class SecurityScanGate:
                 timeout=300,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_semgrep_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
@@ -140,7 +160,7 @@ class SecurityScanGate:
                 timeout=240,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_osv_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
@@ -151,7 +171,7 @@ class SecurityScanGate:
         # actionlint scans .github/workflows/**/*.yml by default when run at repo root
         workflows_dir = ctx.repo_root / ".github" / "workflows"
         if not workflows_dir.is_dir():
-            return [], {**meta, "skipped": True, "reason": "no-workflows-dir"}
+            return _skipped(meta, "no-workflows-dir")
         try:
             proc = subprocess.run(
                 ["actionlint", "-format", "{{range $err := .}}{{$err.Filepath}}:{{$err.Line}}:{{$err.Column}}: {{$err.Message}} [{{$err.Kind}}]\n{{end}}"],
@@ -162,7 +182,7 @@ class SecurityScanGate:
                 timeout=120,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_actionlint_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
@@ -180,7 +200,7 @@ class SecurityScanGate:
                 timeout=300,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_checkov_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
@@ -191,7 +211,7 @@ class SecurityScanGate:
         # tflint only runs against Terraform files
         has_tf = any(p.suffix == ".tf" for p in ctx.repo_root.rglob("*.tf"))
         if not has_tf:
-            return [], {**meta, "skipped": True, "reason": "no-terraform-files"}
+            return _skipped(meta, "no-terraform-files")
         try:
             proc = subprocess.run(
                 ["tflint", "--format", "json", "--recursive"],
@@ -202,13 +222,28 @@ class SecurityScanGate:
                 timeout=180,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-            return [], {**meta, "skipped": True, "reason": f"{type(exc).__name__}: {exc}"}
+            return _skipped_on_error(meta, exc)
         meta["exit_code"] = proc.returncode
         findings = _parse_tflint_output(proc.stdout, self.gate_id)
         meta["finding_count"] = len(findings)
         return findings, meta
 
 
+# ---------- runner result helpers ----------
+
+
+def _skipped(meta: dict[str, Any], reason: str) -> tuple[list[Finding], dict[str, Any]]:
+    """Empty result for a runner that was invoked but could not scan."""
+    return [], {**meta, "skipped": True, "reason": reason}
+
+
+def _skipped_on_error(
+    meta: dict[str, Any], exc: BaseException
+) -> tuple[list[Finding], dict[str, Any]]:
+    """Skipped result for a runner whose tool raised while scanning."""
+    return _skipped(meta, f"{type(exc).__name__}: {exc}")
+
+
 # ---------- pure parsers (testable without subprocess) ----------
 
 
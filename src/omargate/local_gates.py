@@ -19,6 +19,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Iterable
 
@@ -46,6 +47,8 @@ from .scaffold import parse_scaffold_ownership
 # (from omargate.local_gates import _parse_scaffold_ownership) keep working.
 _parse_scaffold_ownership = parse_scaffold_ownership
 
+_SEVERITY_ORDER = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -138,16 +141,12 @@ def _severity_blocks(sev: str, threshold: str) -> bool:
     """Return True if a finding at `sev` should block when threshold=`threshold`."""
     if threshold == "never":
         return False
-    order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-    return order.get(sev, 99) <= order.get(threshold, -1)
+    return _SEVERITY_ORDER.get(sev, 99) <= _SEVERITY_ORDER.get(threshold, -1)
 
 
 def _count_by_severity(findings: Iterable[Finding]) -> dict[str, int]:
-    counts = {"P0": 0, "P1": 0, "P2": 0, "P3": 0}
-    for f in findings:
-        if f.severity in counts:
-            counts[f.severity] += 1
-    return counts
+    tally = Counter(f.severity for f in findings)
+    return {severity: tally[severity] for severity in ("P0", "P1", "P2", "P3")}
 
 
 def _write_findings_jsonl(findings: list[Finding], path: Path) -> None:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
+import itertools
 import json
 import os
+import random
 import re
 import urllib.parse
 import shlex
@@ -11,7 +14,9 @@ import sys
 import time
 import urllib.error
 import urllib.request
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +52,40 @@ _SBOM_PYTHON_REQUIREMENTS_FILES = (
 _OMAR_COMMENT_MARKER_PREFIX = "sentinelayer:omar-gate:"
 _LOCAL_FINDINGS_RELATIVE_PATH = Path(".omargate/local/FINDINGS.jsonl")
 _COMMENT_FINDING_LIMIT = 10
+_SCAN_MODE_COMMANDS = {
+    **dict.fromkeys(
+        ("baseline", "baseline-only", "baseline_scan", "baseline-scan"),
+        "/omar baseline",
+    ),
+    **dict.fromkeys(
+        (
+            "audit",
+            "audit-full",
+            "audit_full",
+            "full-depth",
+            "full_depth",
+            "full-depth-13",
+            "full_depth_13",
+            "full",
+        ),
+        "/omar full-depth",
+    ),
+}
+_STATUS_POLL_JITTER_RATIO = 0.2
+_SEVERITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+_SEVERITY_TABLE_LABELS = (
+    ("P0", "P0 (Critical)"),
+    ("P1", "P1 (High)"),
+    ("P2", "P2 (Medium)"),
+    ("P3", "P3 (Low)"),
+)
+_GATE_STATUS_ICONS = {"passed": "✅", "blocked": "❌", "error": "❌"}
+_GATE_STATUS_LABELS = {"passed": "Passed", "blocked": "Blocked"}
+_SLUG_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_MODEL_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._:-")
+_GITHUB_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-")
+_FORBIDDEN_SHELL_TOKENS = frozenset({"&&", "||", "|", ";", ">", "<"})
 
 
 @dataclass(frozen=True)
@@ -143,9 +182,7 @@ def _normalize_spec_hash(value: str | None) -> str | None:
     normalized = str(value or "").strip().lower()
     if not normalized:
         return None
-    if len(normalized) != 64:
-        return None
-    if any(ch not in "0123456789abcdef" for ch in normalized):
+    if len(normalized) != 64 or not _HEX_DIGITS.issuperset(normalized):
         return None
     return normalized
 
@@ -157,7 +194,7 @@ def _normalize_spec_binding_mode(value: str | None) -> str:
     return "none"
 
 
-def _normalize_playwright_mode(value: str | None) -> str:
+def _normalize_gate_mode(value: str | None) -> str:
     normalized = str(value or "").strip().lower()
     if normalized in {"baseline", "smoke", "pr"}:
         return "baseline"
@@ -166,21 +203,16 @@ def _normalize_playwright_mode(value: str | None) -> str:
     return "off"
 
 
-def _normalize_sbom_mode(value: str | None) -> str:
-    normalized = str(value or "").strip().lower()
-    if normalized in {"baseline", "pr", "smoke"}:
-        return "baseline"
-    if normalized in {"audit", "deep", "full", "full-depth"}:
-        return "audit"
-    return "off"
+# Playwright and SBOM accept the same mode aliases; both names are kept for callers.
+_normalize_playwright_mode = _normalize_gate_mode
+_normalize_sbom_mode = _normalize_gate_mode
 
 
 def _normalize_model_id(value: str | None, *, default: str) -> str:
     normalized = str(value or "").strip()
     if not normalized:
         return default
-    allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._:-")
-    if len(normalized) > 128 or any(ch not in allowed for ch in normalized):
+    if len(normalized) > 128 or not _MODEL_ID_CHARS.issuperset(normalized):
         return default
     return normalized
 
@@ -556,7 +588,7 @@ def _api_json_request(
     try:
         with urllib.request.urlopen(request, timeout=_API_REQUEST_TIMEOUT_SECONDS) as response:
             _capture_response_headers(response_headers, getattr(response, "headers", None))
-            raw = response.read().decode("utf-8")
+            raw = response.read()
             return json.loads(raw) if raw else {}
     except urllib.error.HTTPError as exc:
         captured_headers = _capture_response_headers(response_headers, exc.headers)
@@ -570,6 +602,26 @@ def _api_json_request(
         raise ApiRequestError(f"API request failed [{url}]: {exc}") from exc
 
 
+def _llm_policy_payload(config: BridgeConfig) -> dict[str, Any]:
+    return {
+        "sentinelayer_managed_llm": config.sentinelayer_managed_llm,
+        "model": config.model,
+        "model_fallback": config.model_fallback,
+        "use_codex": config.use_codex,
+        "codex_only": config.codex_only,
+        "codex_model": config.codex_model,
+        "llm_failure_policy": config.llm_failure_policy,
+    }
+
+
+def _llm_policy_label(config: BridgeConfig) -> str:
+    return (
+        f"managed={str(config.sentinelayer_managed_llm).lower()} "
+        f"model={config.model} codex_model={config.codex_model} "
+        f"fallback={config.model_fallback} failure_policy={config.llm_failure_policy}"
+    )
+
+
 def _build_trigger_payload(
     config: BridgeConfig,
     *,
@@ -590,15 +642,7 @@ def _build_trigger_payload(
     trigger_payload["spec_binding_mode"] = config.spec_binding_mode
     if config.spec_sources:
         trigger_payload["spec_sources"] = config.spec_sources
-    trigger_payload["llm_policy"] = {
-        "sentinelayer_managed_llm": config.sentinelayer_managed_llm,
-        "model": config.model,
-        "model_fallback": config.model_fallback,
-        "use_codex": config.use_codex,
-        "codex_only": config.codex_only,
-        "codex_model": config.codex_model,
-        "llm_failure_policy": config.llm_failure_policy,
-    }
+    trigger_payload["llm_policy"] = _llm_policy_payload(config)
     return trigger_payload
 
 
@@ -621,23 +665,30 @@ def _github_api_json_request(
         body = json.dumps(payload).encode("utf-8")
     request = urllib.request.Request(url=url, method=method, data=body, headers=headers)
     with urllib.request.urlopen(request, timeout=20) as response:
-        raw = response.read().decode("utf-8")
+        raw = response.read()
         return json.loads(raw) if raw else None
 
 
-def _github_api_repo_url(repo_full_name: str, path: str) -> str:
-    repo = str(repo_full_name or "").strip()
+def _split_github_repo(repo: str) -> tuple[str, str] | None:
     if repo.count("/") != 1:
-        raise RuntimeError(f"Invalid GitHub repository name: {repo!r}")
+        return None
     owner, name = repo.split("/", 1)
-    allowed_repo_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-")
     if (
         not owner
         or not name
-        or any(ch not in allowed_repo_chars for ch in owner)
-        or any(ch not in allowed_repo_chars for ch in name)
+        or not _GITHUB_NAME_CHARS.issuperset(owner)
+        or not _GITHUB_NAME_CHARS.issuperset(name)
     ):
+        return None
+    return owner, name
+
+
+def _github_api_repo_url(repo_full_name: str, path: str) -> str:
+    repo = str(repo_full_name or "").strip()
+    parts = _split_github_repo(repo)
+    if parts is None:
         raise RuntimeError(f"Invalid GitHub repository name: {repo!r}")
+    owner, name = parts
     normalized_path = str(path or "").lstrip("/")
     return (
         "https://api.github.com/repos/"
@@ -658,26 +709,12 @@ def _resolve_pr_number_from_commit(
     token = str(github_token or "").strip()
     if not repo or not commit or not token:
         return None
-    if repo.count("/") != 1:
-        return None
-    owner, name = repo.split("/", 1)
-    allowed_repo_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-")
-    if (
-        not owner
-        or not name
-        or any(ch not in allowed_repo_chars for ch in owner)
-        or any(ch not in allowed_repo_chars for ch in name)
-    ):
+    if _split_github_repo(repo) is None:
         return None
-    allowed_commit_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-")
-    if len(commit) > 128 or any(ch not in allowed_commit_chars for ch in commit):
+    if len(commit) > 128 or not _GITHUB_NAME_CHARS.issuperset(commit):
         return None
 
-    url = (
-        "https://api.github.com/repos/"
-        f"{urllib.parse.quote(owner, safe='')}/{urllib.parse.quote(name, safe='')}"
-        f"/commits/{urllib.parse.quote(commit, safe='')}/pulls"
-    )
+    url = _github_api_repo_url(repo, f"commits/{urllib.parse.quote(commit, safe='')}/pulls")
     try:
         response = _github_api_json_request(url=url, github_token=token)
     except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError):
@@ -750,20 +787,7 @@ def _detect_pr_number(
 
 def _command_for_scan_mode(scan_mode: str) -> str:
     normalized = str(scan_mode or "").strip().lower()
-    if normalized in {"baseline", "baseline-only", "baseline_scan", "baseline-scan"}:
-        return "/omar baseline"
-    if normalized in {
-        "audit",
-        "audit-full",
-        "audit_full",
-        "full-depth",
-        "full_depth",
-        "full-depth-13",
-        "full_depth_13",
-        "full",
-    }:
-        return "/omar full-depth"
-    return "/omar deep-scan"
+    return _SCAN_MODE_COMMANDS.get(normalized, "/omar deep-scan")
 
 
 def _parse_safe_command(command: str) -> list[str]:
@@ -776,8 +800,7 @@ def _parse_safe_command(command: str) -> list[str]:
         raise RuntimeError(f"Invalid Playwright command syntax: {exc}") from exc
     if not args:
         raise RuntimeError("Playwright command resolved to empty arguments.")
-    forbidden_tokens = {"&&", "||", "|", ";", ">", "<"}
-    if any(token in forbidden_tokens for token in args):
+    if not _FORBIDDEN_SHELL_TOKENS.isdisjoint(args):
         raise RuntimeError(
             "Playwright command contains forbidden shell control tokens. "
             "Use a single executable command with arguments."
@@ -813,7 +836,7 @@ def _execute_playwright_gate(config: BridgeConfig) -> tuple[str, str]:
         env["PLAYWRIGHT_TEST_BASE_URL"] = config.playwright_base_url
         env.setdefault("BASE_URL", config.playwright_base_url)
 
-    started = time.time()
+    started = time.perf_counter()
     if config.playwright_bootstrap:
         print("::notice::Playwright gate: bootstrapping npm dependencies and browser runtime.")
         install_code = _run_command_args(["npm", "ci", "--ignore-scripts"], env=env)
@@ -835,7 +858,7 @@ def _execute_playwright_gate(config: BridgeConfig) -> tuple[str, str]:
 
     print(f"::notice::Playwright gate: executing mode={mode} command=`{command}`")
     run_code = _run_command(command, env=env)
-    duration = int(round(time.time() - started))
+    duration = int(round(time.perf_counter() - started))
     if run_code != 0:
         raise RuntimeError(
             "Playwright gate failed "
@@ -856,7 +879,7 @@ def _resolve_sbom_output_dir(workspace: Path, configured_output_dir: str) -> Pat
 def _discover_requirements_file(workspace: Path) -> Path | None:
     for file_name in _SBOM_PYTHON_REQUIREMENTS_FILES:
         candidate = workspace / file_name
-        if candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             return candidate
     return None
 
@@ -1027,10 +1050,10 @@ def _execute_sbom_gate(config: BridgeConfig) -> tuple[str, str]:
 
     env = os.environ.copy()
     env["SENTINELAYER_SBOM_OUTPUT_DIR"] = str(config.sbom_output_dir or _SBOM_DEFAULT_OUTPUT_DIR)
-    started = time.time()
+    started = time.perf_counter()
     print(f"::notice::SBOM gate: executing mode={mode} command=`{command}`")
     run_code = _run_command(command, env=env)
-    duration = int(round(time.time() - started))
+    duration = int(round(time.perf_counter() - started))
     if run_code != 0:
         raise RuntimeError(
             "SBOM gate failed "
@@ -1041,17 +1064,18 @@ def _execute_sbom_gate(config: BridgeConfig) -> tuple[str, str]:
 
 
 def _blocking_count(*, severity_gate: str, counts: dict[str, int]) -> int:
-    gate = str(severity_gate or "P1").strip().upper()
-    p0 = int(counts.get("P0") or 0)
-    p1 = int(counts.get("P1") or 0)
-    p2 = int(counts.get("P2") or 0)
-    if gate == "NONE":
-        return 0
-    if gate == "P0":
-        return p0
-    if gate == "P2":
-        return p0 + p1 + p2
-    return p0 + p1
+    return sum(int(counts.get(severity) or 0) for severity in _blocking_severities(severity_gate))
+
+
+def _status_poll_delay(poll_seconds: float, remaining_seconds: float) -> float:
+    """Jitter the poll interval so concurrent runs don't poll in lock-step.
+
+    The delay is capped at the time left before the wait deadline, so the last
+    sleep ends at the deadline and the caller can make one final status poll
+    there before giving up.
+    """
+    jitter = random.uniform(-_STATUS_POLL_JITTER_RATIO, _STATUS_POLL_JITTER_RATIO)
+    return max(0.0, min(poll_seconds * (1.0 + jitter), remaining_seconds))
 
 
 def _terminal_status(status: str) -> bool:
@@ -1109,7 +1133,7 @@ def _workspace_root() -> Path:
 
 
 def _safe_run_slug(run_id: str) -> str:
-    slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", str(run_id or "").strip()).strip(".-")
+    slug = _SLUG_UNSAFE_CHARS_RE.sub("-", str(run_id or "").strip()).strip(".-")
     return slug[:160] or "manual-trigger"
 
 
@@ -1133,12 +1157,8 @@ def _load_local_findings(workspace: Path) -> list[dict[str, Any]]:
 
 
 def _counts_for_findings(findings: list[dict[str, Any]]) -> dict[str, int]:
-    counts = {"P0": 0, "P1": 0, "P2": 0, "P3": 0}
-    for row in findings:
-        severity = str(row.get("severity") or "").strip().upper()
-        if severity in counts:
-            counts[severity] += 1
-    return counts
+    tally = Counter(str(row.get("severity") or "").strip().upper() for row in findings)
+    return {severity: tally[severity] for severity in ("P0", "P1", "P2", "P3")}
 
 
 def _local_deterministic_run_id(
@@ -1148,7 +1168,7 @@ def _local_deterministic_run_id(
     commit_sha: str,
     command: str,
 ) -> str:
-    repo_slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", config.repo_full_name).strip(".-")
+    repo_slug = _SLUG_UNSAFE_CHARS_RE.sub("-", config.repo_full_name).strip(".-")
     repo_slug = repo_slug[:80] or "repo"
     payload = {
         "command": command,
@@ -1183,7 +1203,9 @@ def _normalize_counts(raw_counts: Any, fallback: dict[str, int] | None = None) -
 
 
 def _finding_scope(row: dict[str, Any]) -> tuple[str, int]:
-    scope = row.get("scope") if isinstance(row.get("scope"), dict) else {}
+    scope = row.get("scope")
+    if not isinstance(scope, dict):
+        scope = {}
     raw_path = (
         scope.get("path")
         or scope.get("file")
@@ -1204,25 +1226,30 @@ def _finding_scope(row: dict[str, Any]) -> tuple[str, int]:
 
 
 def _finding_sort_key(row: dict[str, Any]) -> tuple[int, str, int]:
-    sev_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
     severity = str(row.get("severity") or "").upper()
     file_path, line = _finding_scope(row)
-    return (sev_order.get(severity, 99), file_path, line)
+    return (_SEVERITY_RANK.get(severity, 99), file_path, line)
 
 
-def _truncate_markdown(value: str, *, limit: int = 320) -> str:
-    clean = " ".join(str(value or "").replace("\r", " ").replace("\n", " ").split())
+def _truncate_markdown(value: Any, *, limit: int = 320) -> str:
+    if not value:
+        return ""
+    clean = " ".join(str(value).split())
     if len(clean) <= limit:
         return clean
-    return clean[: max(0, limit - 3)].rstrip() + "..."
+    return f"{clean[: max(0, limit - 3)].rstrip()}..."
 
 
-def _github_blob_url(repo_full_name: str, commit_sha: str, file_path: str, line: int) -> str:
+def _github_blob_base(repo_full_name: str, commit_sha: str) -> str:
     repo = urllib.parse.quote(str(repo_full_name or "").strip(), safe="/")
     commit = urllib.parse.quote(str(commit_sha or "HEAD").strip() or "HEAD", safe="")
+    return f"https://github.com/{repo}/blob/{commit}/"
+
+
+def _github_blob_url(blob_base: str, file_path: str, line: int) -> str:
     path = urllib.parse.quote(str(file_path or "").lstrip("/"), safe="/")
     suffix = f"#L{line}" if line > 0 else ""
-    return f"https://github.com/{repo}/blob/{commit}/{path}{suffix}"
+    return f"{blob_base}{path}{suffix}"
 
 
 def _fetch_backend_run_findings(
@@ -1262,19 +1289,39 @@ def _backend_counts(payload: dict[str, Any] | None, fallback: dict[str, int]) ->
     return _normalize_counts(payload.get("severity_counts"), fallback)
 
 
-def _infer_stack(workspace: Path) -> list[str]:
-    stack: list[str] = []
+def _stack_file_markers(workspace: Path) -> set[str]:
+    # Walks the workspace once, stopping when all markers are found. Directories
+    # in _SPEC_DISCOVERY_SKIP_DIRS are pruned, so .ts/.tf/Dockerfile files under
+    # node_modules, dist, build, .venv and the like do not count toward the stack.
+    markers: set[str] = set()
+    for _root, dirs, files in os.walk(workspace):
+        dirs[:] = [directory for directory in dirs if directory not in _SPEC_DISCOVERY_SKIP_DIRS]
+        for file_name in files:
+            if file_name == "Dockerfile":
+                markers.add("Dockerfile")
+            elif file_name.endswith(".ts"):
+                markers.add(".ts")
+            elif file_name.endswith(".tf"):
+                markers.add(".tf")
+        if len(markers) == 3:
+            break
+    return markers
 
-    def add(name: str) -> None:
-        if name not in stack:
-            stack.append(name)
 
-    package_json = workspace / "package.json"
+def _infer_stack(workspace: Path) -> list[str]:
+    stack: list[str] = []
+    markers = _stack_file_markers(workspace)
     package_text = ""
-    if package_json.exists():
-        add("Node.js")
+    try:
+        package_raw = (workspace / "package.json").read_bytes()
+    except FileNotFoundError:
+        package_raw = None
+    except OSError:
+        package_raw = b""  # present but unreadable still signals Node.js
+    if package_raw is not None:
+        stack.append("Node.js")
         try:
-            package_payload = json.loads(package_json.read_text(encoding="utf-8"))
+            package_payload = json.loads(package_raw)
             deps = {
                 **(package_payload.get("dependencies") if isinstance(package_payload.get("dependencies"), dict) else {}),
                 **(
@@ -1284,33 +1331,32 @@ def _infer_stack(workspace: Path) -> list[str]:
                 ),
             }
             package_text = " ".join(str(key).lower() for key in deps)
-        except (OSError, json.JSONDecodeError):
+        except ValueError:
             package_text = ""
     if "next" in package_text or (workspace / "next.config.js").exists() or (workspace / "next.config.mjs").exists():
-        add("Next.js")
+        stack.append("Next.js")
     if "react" in package_text:
-        add("React")
-    if (workspace / "tsconfig.json").exists() or list(workspace.glob("**/*.ts"))[:1]:
-        add("TypeScript")
+        stack.append("React")
+    if (workspace / "tsconfig.json").exists() or ".ts" in markers:
+        stack.append("TypeScript")
     if (workspace / "pyproject.toml").exists() or (workspace / "requirements.txt").exists():
-        add("Python")
-    if list(workspace.glob("**/*.tf"))[:1]:
-        add("Terraform")
-    if (workspace / "Dockerfile").exists() or list(workspace.glob("**/Dockerfile"))[:1]:
-        add("Docker")
+        stack.append("Python")
+    if ".tf" in markers:
+        stack.append("Terraform")
+    if "Dockerfile" in markers:
+        stack.append("Docker")
     return stack[:6] or ["unspecified"]
 
 
 def _readme_label(workspace: Path) -> str:
     for name in ("README.md", "readme.md", "README.txt"):
         path = workspace / name
-        if not path.exists():
-            continue
         try:
-            for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-                cleaned = line.strip().lstrip("#").strip()
-                if cleaned:
-                    return f"{name}: {_truncate_markdown(cleaned, limit=120)}"
+            with path.open(encoding="utf-8", errors="ignore") as handle:
+                for line in handle:
+                    cleaned = line.strip().lstrip("#").strip()
+                    if cleaned:
+                        return f"{name}: {_truncate_markdown(cleaned, limit=120)}"
         except OSError:
             continue
     return "README: not found"
@@ -1358,56 +1404,52 @@ def _render_top_findings(
     repo_full_name: str,
     commit_sha: str,
     findings: list[dict[str, Any]],
-) -> str:
+) -> list[str]:
     if not findings:
-        return "No findings were returned for this run."
+        return ["No findings were returned for this run."]
 
+    blob_base = _github_blob_base(repo_full_name, commit_sha)
     lines: list[str] = []
-    for idx, row in enumerate(sorted(findings, key=_finding_sort_key)[:_COMMENT_FINDING_LIMIT], start=1):
+    for idx, row in enumerate(
+        heapq.nsmallest(_COMMENT_FINDING_LIMIT, findings, key=_finding_sort_key), start=1
+    ):
         severity = str(row.get("severity") or "P3").upper()
         file_path, line = _finding_scope(row)
         locator = f"{file_path}:{line}" if line > 0 else file_path
-        title = _truncate_markdown(str(row.get("title") or row.get("description") or "Finding"))
-        impact = _truncate_markdown(str(row.get("impact") or ""), limit=220)
+        title = _truncate_markdown(row.get("title") or row.get("description") or "Finding")
+        impact = _truncate_markdown(row.get("impact"), limit=220)
         category = _truncate_markdown(
-            str(row.get("category") or row.get("tool") or row.get("gateId") or "review"),
+            row.get("category") or row.get("tool") or row.get("gateId") or "review",
             limit=80,
         )
-        link = _github_blob_url(repo_full_name, commit_sha, file_path, line)
+        link = _github_blob_url(blob_base, file_path, line)
         description = f"{title} {impact}".strip()
         lines.append(f"{idx}. **{severity}** [`{locator}`]({link}) - **{category}**: {description}")
-        fix = _truncate_markdown(
-            str(row.get("remediation_guidance") or row.get("recommendedFix") or ""),
-            limit=240,
-        )
+        fix = _truncate_markdown(row.get("remediation_guidance") or row.get("recommendedFix"), limit=240)
         if fix:
             lines.append(f"   > Fix: {fix}")
 
     if len(findings) > _COMMENT_FINDING_LIMIT:
         remaining = len(findings) - _COMMENT_FINDING_LIMIT
         lines.append(f"\n_Additional findings omitted from this comment: {remaining}. See artifacts._")
-    return "\n".join(lines)
+    return lines
 
 
-def _severity_blocks_merge(severity: str, severity_gate: str) -> bool:
+@lru_cache(maxsize=16)
+def _blocking_severities(severity_gate: str) -> tuple[str, ...]:
     gate = str(severity_gate or "P1").strip().upper()
-    severity = str(severity or "").strip().upper()
     if gate == "NONE":
-        return False
+        return ()
     if gate == "P0":
-        return severity == "P0"
+        return ("P0",)
     if gate == "P2":
-        return severity in {"P0", "P1", "P2"}
-    return severity in {"P0", "P1"}
+        return ("P0", "P1", "P2")
+    return ("P0", "P1")
 
 
 def _result_line(*, gate_status: str, severity_gate: str, counts: dict[str, int]) -> str:
-    label = "Passed" if gate_status == "passed" else ("Blocked" if gate_status == "blocked" else "Errored")
-    blocking_names = [
-        severity
-        for severity in ("P0", "P1", "P2", "P3")
-        if _severity_blocks_merge(severity, severity_gate)
-    ]
+    label = _GATE_STATUS_LABELS.get(gate_status, "Errored")
+    blocking_names = _blocking_severities(severity_gate)
     blocking_total = sum(int(counts.get(severity) or 0) for severity in blocking_names)
     if gate_status == "passed" and blocking_names:
         detail = f"no {'/'.join(blocking_names)} findings"
@@ -1429,7 +1471,7 @@ def _render_bridge_pr_comment(
     command: str,
     status: str,
     progress: str,
-    counts: dict[str, int],
+    display_counts: dict[str, int],
     gate_status: str,
     run_url: str,
     evidence_url: str,
@@ -1440,19 +1482,15 @@ def _render_bridge_pr_comment(
     sbom_mode: str,
     sbom_detail: str,
     local_findings: list[dict[str, Any]],
-    backend_findings_payload: dict[str, Any] | None,
+    backend_findings: list[dict[str, Any]],
+    findings_source: str,
     workspace: Path,
     commit_sha: str,
 ) -> str:
-    local_counts = {"P0": 0, "P1": 0, "P2": 0, "P3": 0}
-    for row in local_findings:
-        severity = str(row.get("severity") or "").upper()
-        if severity in local_counts:
-            local_counts[severity] += 1
+    local_counts = _counts_for_findings(local_findings)
+    blocking = _blocking_severities(config.severity_gate)
 
-    backend_findings = _backend_findings(backend_findings_payload)
     display_findings = backend_findings if backend_findings else local_findings
-    display_counts = _backend_counts(backend_findings_payload, counts)
     marker = _omar_comment_marker(config.repo_full_name, pr_number)
     counts_marker = json.dumps(display_counts, separators=(",", ":"), sort_keys=True)
     top_findings = _render_top_findings(
@@ -1460,8 +1498,7 @@ def _render_bridge_pr_comment(
         commit_sha=commit_sha,
         findings=display_findings,
     )
-    status_icon = "✅" if gate_status == "passed" else ("❌" if gate_status in {"blocked", "error"} else "⏳")
-    findings_source = str((backend_findings_payload or {}).get("findings_source") or "").strip()
+    status_icon = _GATE_STATUS_ICONS.get(gate_status, "⏳")
     if not findings_source:
         findings_source = (
             "skipped:deterministic_only"
@@ -1479,25 +1516,20 @@ def _render_bridge_pr_comment(
         "",
         "| Severity | Count | Blocks Merge? |",
         "|---|---:|---|",
-        f"| P0 (Critical) | {display_counts['P0']} | {'Yes' if _severity_blocks_merge('P0', config.severity_gate) else 'No'} |",
-        f"| P1 (High) | {display_counts['P1']} | {'Yes' if _severity_blocks_merge('P1', config.severity_gate) else 'No'} |",
-        f"| P2 (Medium) | {display_counts['P2']} | {'Yes' if _severity_blocks_merge('P2', config.severity_gate) else 'No'} |",
-        f"| P3 (Low) | {display_counts['P3']} | {'Yes' if _severity_blocks_merge('P3', config.severity_gate) else 'No'} |",
+        *(
+            f"| {label} | {display_counts[severity]} | {'Yes' if severity in blocking else 'No'} |"
+            for severity, label in _SEVERITY_TABLE_LABELS
+        ),
         "",
         f"Codebase Synopsis: {_codebase_synopsis(workspace)}",
         "",
         "### Top Findings",
-        top_findings,
+        *top_findings,
         "",
         "### Run Details",
         f"- Run status: `{status}` / `{progress}`",
         f"- Scan: `{command}`",
-        (
-            "- LLM policy: "
-            f"`managed={str(config.sentinelayer_managed_llm).lower()} "
-            f"model={config.model} codex_model={config.codex_model} "
-            f"fallback={config.model_fallback} failure_policy={config.llm_failure_policy}`"
-        ),
+        f"- LLM policy: `{_llm_policy_label(config)}`",
         f"- Backend findings source: `{findings_source}`",
         f"- Action-local gates: `P0={local_counts['P0']} P1={local_counts['P1']} P2={local_counts['P2']} P3={local_counts['P3']}`",
     ]
@@ -1506,11 +1538,11 @@ def _render_bridge_pr_comment(
     if evidence_url:
         lines.append(f"- Evidence: {evidence_url}")
     lines.extend(
-        [
+        (
             f"- Run id: `{run_id or 'manual-trigger'}`",
             f"- Playwright gate: `{playwright_status}` ({playwright_mode}) - {playwright_detail}",
             f"- SBOM gate: `{sbom_status}` ({sbom_mode}) - {sbom_detail}",
-        ]
+        )
     )
     return "\n".join(lines)
 
@@ -1597,40 +1629,31 @@ def _write_bridge_artifacts(
 
     summary_json = json.dumps(summary, indent=2, sort_keys=True)
     (run_dir / "RUN_SUMMARY.json").write_text(summary_json + "\n", encoding="utf-8")
-    (run_dir / "REVIEW_BRIEF.md").write_text(comment_body + "\n", encoding="utf-8")
-    (run_dir / "AUDIT_REPORT.md").write_text(comment_body + "\n", encoding="utf-8")
-    (artifacts_dir / "BRIDGE_SUMMARY.md").write_text(comment_body + "\n", encoding="utf-8")
+    report_bytes = (comment_body + "\n").encode("utf-8")
+    (run_dir / "REVIEW_BRIEF.md").write_bytes(report_bytes)
+    (run_dir / "AUDIT_REPORT.md").write_bytes(report_bytes)
+    (artifacts_dir / "BRIDGE_SUMMARY.md").write_bytes(report_bytes)
 
     findings_path = run_dir / "FINDINGS.jsonl"
-    merged_findings: list[dict[str, Any]] = []
     seen_keys: set[str] = set()
-    for row in list(backend_findings or []) + list(local_findings or []):
-        if not isinstance(row, dict):
-            continue
-        fingerprint = str(
-            row.get("finding_fingerprint")
-            or row.get("fingerprint")
-            or row.get("finding_id")
-            or ""
-        ).strip()
-        if not fingerprint:
-            file_path, line = _finding_scope(row)
-            fingerprint = "|".join(
-                [
-                    str(row.get("severity") or ""),
-                    str(row.get("category") or row.get("tool") or ""),
-                    file_path,
-                    str(line),
-                    str(row.get("title") or row.get("message") or row.get("impact") or ""),
-                ]
-            )
-        if fingerprint in seen_keys:
-            continue
-        seen_keys.add(fingerprint)
-        merged_findings.append(row)
-
     with findings_path.open("w", encoding="utf-8") as handle:
-        for row in merged_findings:
+        for row in itertools.chain(backend_findings or (), local_findings or ()):
+            if not isinstance(row, dict):
+                continue
+            fingerprint = str(
+                row.get("finding_fingerprint")
+                or row.get("fingerprint")
+                or row.get("finding_id")
+                or ""
+            ).strip()
+            if not fingerprint:
+                file_path, line = _finding_scope(row)
+                category = row.get("category") or row.get("tool") or ""
+                headline = row.get("title") or row.get("message") or row.get("impact") or ""
+                fingerprint = f"{row.get('severity') or ''}|{category}|{file_path}|{line}|{headline}"
+            if fingerprint in seen_keys:
+                continue
+            seen_keys.add(fingerprint)
             handle.write(json.dumps(row, separators=(",", ":"), sort_keys=True))
             handle.write("\n")
 
@@ -1746,14 +1769,14 @@ def main() -> int:
             progress = "queued"
 
             if config.wait_for_completion and run_id:
-                deadline = time.time() + float(config.wait_timeout_seconds)
-                while time.time() < deadline:
-                    status_url = f"{config.api_url}/api/v1/github-app/runs/{run_id}/status"
-                    if trigger_delivery_id:
-                        status_url = (
-                            f"{status_url}?delivery_id="
-                            f"{urllib.parse.quote(trigger_delivery_id, safe='')}"
-                        )
+                status_url = f"{config.api_url}/api/v1/github-app/runs/{run_id}/status"
+                if trigger_delivery_id:
+                    status_url = (
+                        f"{status_url}?delivery_id="
+                        f"{urllib.parse.quote(trigger_delivery_id, safe='')}"
+                    )
+                deadline = time.monotonic() + float(config.wait_timeout_seconds)
+                while True:
                     status_payload = _tracked_api_json_request(
                         method="GET",
                         url=status_url,
@@ -1771,11 +1794,12 @@ def main() -> int:
                         }
                     if _terminal_status(status):
                         break
-                    time.sleep(float(config.wait_poll_seconds))
-                else:
-                    raise RuntimeError(
-                        f"Timed out waiting for run completion after {config.wait_timeout_seconds}s (run_id={run_id})"
-                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"Timed out waiting for run completion after {config.wait_timeout_seconds}s (run_id={run_id})"
+                        )
+                    time.sleep(_status_poll_delay(float(config.wait_poll_seconds), remaining))
 
         blocking = _blocking_count(severity_gate=config.severity_gate, counts=counts)
         gate_status = "passed"
@@ -1817,10 +1841,11 @@ def main() -> int:
                     f"local deterministic gate remains authoritative. {exc}"
                 )
 
+        report_run_id = run_id or str(trigger_response.get("delivery_id") or "manual-trigger")
         _emit_outputs(
             gate_status=gate_status,
             counts=counts,
-            run_id=run_id or str(trigger_response.get("delivery_id") or "manual-trigger"),
+            run_id=report_run_id,
             scan_mode=config.scan_mode,
             severity_gate=config.severity_gate,
             model=config.model,
@@ -1842,14 +1867,15 @@ def main() -> int:
                 run_read_token=run_read_token,
                 api_json_request=_tracked_api_json_request,
             )
+        backend_findings = _backend_findings(backend_findings_payload)
         comment_body = _render_bridge_pr_comment(
             config=config,
             pr_number=pr_number,
-            run_id=run_id or str(trigger_response.get("delivery_id") or "manual-trigger"),
+            run_id=report_run_id,
             command=command,
             status=status,
             progress=progress,
-            counts=counts,
+            display_counts=_backend_counts(backend_findings_payload, counts),
             gate_status=gate_status,
             run_url=run_url,
             evidence_url=evidence_url,
@@ -1860,7 +1886,8 @@ def main() -> int:
             sbom_mode=sbom_mode,
             sbom_detail=sbom_detail,
             local_findings=local_findings,
-            backend_findings_payload=backend_findings_payload,
+            backend_findings=backend_findings,
+            findings_source=str((backend_findings_payload or {}).get("findings_source") or "").strip(),
             workspace=workspace,
             commit_sha=commit_sha,
         )
@@ -1868,14 +1895,14 @@ def main() -> int:
             "action_version": ACTION_VERSION,
             "repository_full_name": config.repo_full_name,
             "pr_number": pr_number,
-            "run_id": run_id or str(trigger_response.get("delivery_id") or "manual-trigger"),
+            "run_id": report_run_id,
             "status": status,
             "progress": progress,
             "gate_status": gate_status,
             "severity_gate": config.severity_gate,
             "scan_command": command,
             "counts": counts,
-            "backend_findings_count": len(_backend_findings(backend_findings_payload)),
+            "backend_findings_count": len(backend_findings),
             "local_findings_count": len(local_findings),
             "run_url": run_url,
             "evidence_url": evidence_url,
@@ -1889,23 +1916,15 @@ def main() -> int:
                 "error": backend_publish_error or None,
             },
             "quota": _quota_output_fields(budget_tracker),
-            "llm_policy": {
-                "sentinelayer_managed_llm": config.sentinelayer_managed_llm,
-                "model": config.model,
-                "model_fallback": config.model_fallback,
-                "use_codex": config.use_codex,
-                "codex_only": config.codex_only,
-                "codex_model": config.codex_model,
-                "llm_failure_policy": config.llm_failure_policy,
-            },
+            "llm_policy": _llm_policy_payload(config),
         }
         _write_bridge_artifacts(
             workspace=workspace,
-            run_id=run_id or str(trigger_response.get("delivery_id") or "manual-trigger"),
+            run_id=report_run_id,
             summary=bridge_summary,
             comment_body=comment_body,
             local_findings=local_findings,
-            backend_findings=_backend_findings(backend_findings_payload),
+            backend_findings=backend_findings,
         )
         comment_url = _upsert_omar_pr_comment(
             config=config,
@@ -1930,7 +1949,7 @@ def main() -> int:
                 else "- Spec hash: `none`"
             ),
             f"- Spec sources: `{len(config.spec_sources)}`",
-            f"- LLM policy: `managed={str(config.sentinelayer_managed_llm).lower()} model={config.model} codex_model={config.codex_model} fallback={config.model_fallback} failure_policy={config.llm_failure_policy}`",
+            f"- LLM policy: `{_llm_policy_label(config)}`",
             f"- Findings: `P0={counts['P0']} P1={counts['P1']} P2={counts['P2']} P3={counts['P3']}`",
             f"- Gate: `{gate_status}` (threshold `{config.severity_gate}`)",
             f"- Playwright gate: `{playwright_status}` ({playwright_mode})",
@@ -347,6 +347,86 @@ class PolicyGateTests(unittest.TestCase):
             self.assertEqual(finding.rule_id, "policy:forbid-pattern:1")
             self.assertEqual(finding.decision, "deny")
 
+    def test_policy_gate_scans_every_readable_file_across_read_batches(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            for i in range(70):
+                (repo / f"mod_{i:02d}.py").write_text(f"x = 1\nTODO {i}\n", encoding="utf-8")
+            (repo / "blob.bin").write_bytes(b"\xff\xfeTODO\n")
+            policy = parse_policy({
+                "policy": {"forbid_patterns": [{"pattern": "TODO", "severity": "P2"}]},
+            })
+
+            result = PolicyGate(policy).run(GateContext(repo_root=repo))
+
+            self.assertEqual(
+                sorted(f.file for f in result.findings),
+                [f"mod_{i:02d}.py" for i in range(70)],
+            )
+            self.assertTrue(all(f.line == 2 for f in result.findings))
+
+    def test_policy_gate_multiple_patterns_keep_rule_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            (repo / "a.ts").write_text("TODO one\nFIXME two\n", encoding="utf-8")
+            (repo / "b.py").write_text("FIXME three\nTODO four\n", encoding="utf-8")
+            policy = parse_policy({
+                "policy": {
+                    "forbid_patterns": [
+                        {"pattern": "TODO", "severity": "P2"},
+                        {"pattern": "(", "severity": "P1"},
+                        {"pattern": "FIXME", "severity": "P3", "in": "*.ts"},
+                    ]
+                },
+            })
+
+            result = PolicyGate(policy).run(GateContext(repo_root=repo))
+
+            self.assertEqual(
+                [f.rule_id for f in result.findings],
+                [
+                    "policy:forbid-pattern:1",
+                    "policy:forbid-pattern:1",
+                    "policy:forbid-pattern:2:invalid-regex",
+                    "policy:forbid-pattern:3",
+                ],
+            )
+            self.assertEqual(
+                sorted((f.file, f.line) for f in result.findings[:2]),
+                [("a.ts", 1), ("b.py", 2)],
+            )
+            self.assertEqual((result.findings[3].file, result.findings[3].line), ("a.ts", 2))
+
+    def test_policy_gate_skips_files_over_size_limit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            (repo / "big.txt").write_text("TODO\n" + "x" * 1_000_000, encoding="utf-8")
+            (repo / "crlf.txt").write_bytes(b"ok\r\nTODO\r\n")
+            policy = parse_policy({
+                "policy": {"forbid_patterns": [{"pattern": "TODO", "severity": "P2"}]},
+            })
+
+            result = PolicyGate(policy).run(GateContext(repo_root=repo))
+
+            self.assertEqual([(f.file, f.line) for f in result.findings], [("crlf.txt", 2)])
+
+    def test_policy_gate_skips_excluded_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            (repo / "node_modules" / "pkg").mkdir(parents=True)
+            (repo / "node_modules" / "pkg" / "index.js").write_text("TODO\n", encoding="utf-8")
+            (repo / ".sentinelayer").mkdir()
+            (repo / ".sentinelayer" / "notes.md").write_text("TODO\n", encoding="utf-8")
+            (repo / "src").mkdir()
+            (repo / "src" / "app.js").write_text("TODO\n", encoding="utf-8")
+            policy = parse_policy({
+                "policy": {"forbid_patterns": [{"pattern": "TODO", "severity": "P2"}]},
+            })
+
+            result = PolicyGate(policy).run(GateContext(repo_root=repo))
+
+            self.assertEqual([f.file for f in result.findings], ["src/app.js"])
+
     def test_policy_gate_ask_decision_is_preserved(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo = Path(tmp)
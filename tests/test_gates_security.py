@@ -9,10 +9,15 @@ requiring the scanner binaries to be installed.
 from __future__ import annotations
 
 import json
+import threading
+import time
 import unittest
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 from omargate.gates import GateContext
+from omargate.gates.findings import Finding
 from omargate.gates.security import (
     SecurityScanGate,
     _extract_cvss_numeric,
@@ -347,6 +352,49 @@ class SecurityScanGateTests(unittest.TestCase):
             if not meta.get("invoked"):
                 self.assertIn(meta.get("reason"), {"disabled", "binary-not-on-path"})
 
+    def test_scanners_run_concurrently_and_keep_scanner_order(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _FakeGate(SecurityScanGate):
+            def _run_gitleaks(self, ctx: GateContext) -> tuple[list[Finding], dict[str, Any]]:
+                barrier.wait()  # deadlocks unless semgrep runs at the same time
+                time.sleep(0.05)  # finish last; results must still come first
+                return [_finding("a.py")], {"tool": "gitleaks", "invoked": True}
+
+            def _run_semgrep(self, ctx: GateContext) -> tuple[list[Finding], dict[str, Any]]:
+                barrier.wait()
+                return [_finding("b.py")], {"tool": "semgrep", "invoked": True}
+
+        gate = _FakeGate(osv_scanner=False, actionlint=False, checkov=False, tflint=False)
+        ctx = GateContext(repo_root=Path.cwd(), changed_files=())
+        with patch("omargate.gates.security.shutil.which", return_value="/usr/bin/tool"):
+            result = gate.run(ctx)
+
+        self.assertEqual([f.file for f in result.findings], ["a.py", "b.py"])
+        self.assertEqual(
+            [meta["tool"] for meta in result.metadata["tools"]],
+            ["gitleaks", "semgrep", "osv-scanner", "actionlint", "checkov", "tflint"],
+        )
+
+    def test_runner_exception_propagates(self) -> None:
+        class _FailingGate(SecurityScanGate):
+            def _run_gitleaks(self, ctx: GateContext) -> tuple[list[Finding], dict[str, Any]]:
+                raise RuntimeError("boom")
+
+        gate = _FailingGate(
+            semgrep=False, osv_scanner=False, actionlint=False, checkov=False, tflint=False
+        )
+        ctx = GateContext(repo_root=Path.cwd(), changed_files=())
+        with (
+            patch("omargate.gates.security.shutil.which", return_value="/usr/bin/tool"),
+            self.assertRaises(RuntimeError),
+        ):
+            gate.run(ctx)
+
+
+def _finding(file: str) -> Finding:
+    return Finding(gate_id="security", tool="t", severity="P2", file=file, line=1, title="x")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,11 +12,13 @@ from omargate.main import (
     _API_REQUEST_TIMEOUT_SECONDS,
     _api_json_request,
     _blocking_count,
+    _blocking_severities,
     _command_for_scan_mode,
     _compute_spec_hash_from_sources,
     _detect_pr_number,
     _execute_playwright_gate,
     _execute_sbom_gate,
+    _infer_stack,
     _has_quota_headers,
     _normalize_llm_failure_policy,
     _normalize_model_id,
@@ -26,6 +28,10 @@ from omargate.main import (
     _normalize_spec_hash,
     _normalize_spec_sources,
     _parse_safe_command,
+    _render_top_findings,
+    _status_poll_delay,
+    _truncate_markdown,
+    _write_bridge_artifacts,
     main,
 )
 
@@ -218,6 +224,60 @@ def test_blocking_count_honors_severity_gate() -> None:
     assert _blocking_count(severity_gate="P3", counts=counts) == 3
 
 
+def test_status_poll_delay_is_jittered_and_capped_by_deadline() -> None:
+    delays = [_status_poll_delay(10.0, 900.0) for _ in range(200)]
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert _status_poll_delay(10.0, 3.5) == 3.5
+    assert _status_poll_delay(10.0, -1.0) == 0.0
+
+
+def test_blocking_severities_follow_severity_gate() -> None:
+    assert _blocking_severities("P0") == ("P0",)
+    assert _blocking_severities(" p1 ") == ("P0", "P1")
+    assert _blocking_severities("") == ("P0", "P1")
+    assert _blocking_severities("P2") == ("P0", "P1", "P2")
+    assert _blocking_severities("none") == ()
+
+
+def test_infer_stack_detects_nested_markers_outside_skipped_dirs(tmp_path: Path) -> None:
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.ts").write_text("export {};\n", encoding="utf-8")
+    assert _infer_stack(tmp_path) == ["unspecified"]
+
+    (tmp_path / "infra" / "modules").mkdir(parents=True)
+    (tmp_path / "infra" / "modules" / "main.tf").write_text("", encoding="utf-8")
+    (tmp_path / "services" / "api").mkdir(parents=True)
+    (tmp_path / "services" / "api" / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    assert _infer_stack(tmp_path) == ["Python", "Terraform", "Docker"]
+
+
+def test_render_top_findings_keeps_most_severe_in_stable_order() -> None:
+    findings = [
+        {"severity": "P3", "title": f"low-{idx}", "file": f"src/low_{idx:02d}.py", "line": 1}
+        for idx in range(12)
+    ]
+    findings.insert(5, {"severity": "P0", "title": "critical", "file": "src/app.py", "line": 7})
+    findings.append({"severity": "P1", "title": "high", "file": "src/app.py", "line": 3})
+
+    lines = _render_top_findings(repo_full_name="owner/repo", commit_sha="abc", findings=findings)
+
+    assert lines[0].startswith("1. **P0** [`src/app.py:7`]")
+    assert "(https://github.com/owner/repo/blob/abc/src/app.py#L7)" in lines[0]
+    assert lines[1].startswith("2. **P1** [`src/app.py:3`]")
+    assert lines[2].startswith("3. **P3** [`src/low_00.py:1`]")
+    assert lines[9].startswith("10. **P3** [`src/low_07.py:1`]")
+    assert lines[-1] == "\n_Additional findings omitted from this comment: 4. See artifacts._"
+
+
+def test_truncate_markdown_collapses_whitespace_and_truncates() -> None:
+    assert _truncate_markdown("line one\r\nline\ttwo  ") == "line one line two"
+    assert _truncate_markdown(None) == ""
+    assert _truncate_markdown("abcdefghij", limit=8) == "abcde..."
+    assert _truncate_markdown("abcdefgh", limit=8) == "abcdefgh"
+
+
 def test_execute_playwright_gate_baseline_with_bootstrap(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     config = _bridge_config(
         tmp_path,
@@ -425,6 +485,7 @@ def test_main_forwards_llm_policy_to_backend_trigger(
         lambda **kwargs: [] if str(kwargs.get("method") or "GET") == "GET" else {"html_url": ""},
     )
     monkeypatch.setenv("GITHUB_OUTPUT", str(output_path))
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
 
     exit_code = main()
     assert exit_code == 0
@@ -849,6 +910,45 @@ def test_main_polls_status_for_exact_trigger_delivery(
     assert status_gets[0]["token"] == "run-read-token-1"
 
 
+def test_main_polls_once_more_at_deadline_before_timing_out(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    config = _bridge_config(tmp_path, wait_for_completion=True)
+    clock = {"now": 1000.0}
+    sleeps: list[float] = []
+    poll_times: list[float] = []
+
+    def _fake_api_request(**kwargs: object) -> dict[str, object]:
+        if str(kwargs.get("method") or "GET") == "POST":
+            return {"status": "accepted", "investigation_run_id": "run-1"}
+        poll_times.append(clock["now"])
+        return {"status": "running", "progress_label": "running"}
+
+    def _fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("omargate.main._load_config", lambda: config)
+    monkeypatch.setattr("omargate.main._execute_playwright_gate", lambda _config: ("skipped", "ok"))
+    monkeypatch.setattr("omargate.main._execute_sbom_gate", lambda _config: ("skipped", "ok"))
+    monkeypatch.setattr("omargate.main._api_json_request", _fake_api_request)
+    monkeypatch.setattr("omargate.main.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("omargate.main.time.sleep", _fake_sleep)
+    monkeypatch.setattr("omargate.main.random.uniform", lambda _low, _high: 0.0)
+    monkeypatch.setenv("GITHUB_OUTPUT", str(tmp_path / "github_output.txt"))
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+
+    exit_code = main()
+
+    assert exit_code != 0
+    assert "Timed out waiting for run completion after 900s (run_id=run-1)" in capsys.readouterr().out
+    assert len(poll_times) == 91
+    assert poll_times[-1] == 1900.0
+    assert sum(sleeps) == 900.0
+
+
 def test_main_updates_existing_omar_pr_comment(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -946,3 +1046,34 @@ def test_api_json_request_uses_long_enough_timeout(
     assert payload == {"ok": True}
     assert captured_timeouts == [_API_REQUEST_TIMEOUT_SECONDS]
     assert _API_REQUEST_TIMEOUT_SECONDS >= 120
+
+
+def test_write_bridge_artifacts_dedupes_backend_and_local_findings(tmp_path: Path) -> None:
+    backend = [
+        {"finding_fingerprint": "fp-1", "title": "backend copy"},
+        {"severity": "P2", "tool": "semgrep", "file": "a.py", "line": 3, "title": "t"},
+    ]
+    local = [
+        {"fingerprint": "fp-1", "title": "local copy"},
+        {"severity": "P2", "tool": "semgrep", "file": "a.py", "line": 3, "title": "t"},
+        {"severity": "P3", "tool": "semgrep", "file": "b.py", "line": 1, "title": "t"},
+        "not-a-dict",
+    ]
+
+    _write_bridge_artifacts(
+        workspace=tmp_path,
+        run_id="run-9",
+        summary={},
+        comment_body="body",
+        local_findings=local,  # type: ignore[arg-type]
+        backend_findings=backend,
+    )
+
+    rows = [
+        json.loads(line)
+        for line in (tmp_path / ".sentinelayer" / "runs" / "run-9" / "FINDINGS.jsonl")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert [row.get("title") for row in rows] == ["backend copy", "t", "t"]
+    assert [row.get("file") for row in rows] == [None, "a.py", "b.py"]